@@ -214,17 +214,30 @@ def buildBatchedQuery(query, injectionTemplates, items, sep=', '):
 	return query, params
 
 
+# cache of query -> (sanitizedQuery, keys), production code runs the same
+# query strings through makePrepQuery over and over so the sanitization
+# becomes a dict lookup after the first call
+_PREP_QUERY_CACHE = {}
+_PREP_QUERY_CACHE_MAX = 256
+
+
 def makePrepQuery(query):
 	"""Function that sanitizes a query by replacing keyword args with a "?" character.
+	Note that results are cached per query string so repeated calls with
+	the same query skip the regex pass.
 	Args:
 		query, str, query to sanitize where arguments to inject are formatted ":<argName>"
-	
+
 	Returns: Tuple[str, Tuple[str]], where the first string is is the sanitized query and
 									 the tuple is a list of the parameter names in order of
 									 occurance, including duplicates. The parameter names
-									 can then be used to extract values from a dictionary 
+									 can then be used to extract values from a dictionary
 									 to pass into a prepared query
 	"""
+	cached = _PREP_QUERY_CACHE.get(query)
+	if cached is not None:
+		# copy the keys so callers cannot mutate the cached entry
+		return (cached[0], list(cached[1]))
 	sanitizedQuery = query
 	keys = []
 	offset = 0
@@ -237,7 +250,10 @@ def makePrepQuery(query):
 		end = match.end()
 		sanitizedQuery = sanitizedQuery[:start - offset] + '?' + sanitizedQuery[end - offset:]
 		offset += ((end - start) - 1)
-	return (sanitizedQuery, keys)
+	if len(_PREP_QUERY_CACHE) >= _PREP_QUERY_CACHE_MAX:
+		_PREP_QUERY_CACHE.clear()
+	_PREP_QUERY_CACHE[query] = (sanitizedQuery, keys)
+	return (sanitizedQuery, list(keys))
 
 
 def runPrepQuery(query, args, database, tx=None):
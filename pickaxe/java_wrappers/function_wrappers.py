@@ -1,4 +1,5 @@
 from java.lang import Runnable
+from java.util.concurrent import Callable
 from java.util.function import Function, Supplier
 
 
@@ -29,6 +30,22 @@ class RunnableWrapper(Runnable):
 		return self._func()
 		
 		
+class CallableWrapper(Callable):
+	"""Python wrapper for java.util.concurrent.Callable
+	Example:
+		...
+		pool = Executors.newFixedThreadPool(4)
+		future = pool.submit(CallableWrapper(lambda: fetchData()))
+		result = future.get()
+	"""
+
+	def __init__(self, func):
+		self._func = func
+
+	def call(self):
+		return self._func()
+
+
 class SupplierWrapper(Supplier):
 	
 	def __init__(self, func):
@@ -57,7 +57,14 @@ class Any(object):
 class UnionMeta(BaseMeta):
 	"""Meta-class for the Union class.
 	"""
-	pass
+
+	def __repr__(cls):
+		# compute the descriptive name lazily so declaring a Union
+		# does not pay for a repr of every member type up front
+		types = cls.__dict__.get('types')
+		if types is None:
+			return type.__repr__(cls)
+		return 'Union{}'.format(types)
 
 
 class Union(object):
@@ -90,10 +97,10 @@ class Union(object):
 		
 		if not types:
 			raise ValueError('Cannot create a Union without types')
-		
-		# compute the name
-		name = 'Union{}'.format(types)
-			
+
+		# note, the descriptive name is computed lazily by UnionMeta.__repr__
+		name = 'Union'
+
 		# override the default implementation for the new class
 		def __new__(cls, value):
 			msg = 'Cannot create second generation {}'.format(cls)
@@ -151,6 +158,10 @@ class EnumMeta(type):
 			object.__setattr__(v, '_enum', cls)
 			object.__setattr__(v, 'name', k)
 			object.__setattr__(cls, k, v)
+		# precompute lookup dicts so forValue/forName and type checking
+		# are dict lookups instead of scans over cls.__dict__
+		object.__setattr__(cls, '_byName', members)
+		object.__setattr__(cls, '_byValue', {v.value: v for v in members.values()})
 			
 	def __setattr__(cls, name, value):
 		raise AttributeError('Cannot overwrite or create attributes for Enums')
@@ -184,27 +195,32 @@ class Enum(object):
 	
 	@classmethod
 	def forValue(cls, value):
-		for k, v in cls.__dict__.items():
-			if isinstance(v, EnumMember) and v.value == value:
-				return v
-		msg = 'Cannot get enum member from value = {}'
-		msg = msg.format(value)
-		raise ValueError(msg)
-					
+		try:
+			return cls._byValue[value]
+		except (KeyError, TypeError):
+			msg = 'Cannot get enum member from value = {}'
+			msg = msg.format(value)
+			raise ValueError(msg)
+
 	@classmethod
 	def forName(cls, name):
-		member = getattr(cls, name, None)
-		if isinstance(member, EnumMember):
-			return member
-		msg = 'Cannot get enum member from name = {}'
-		msg = msg.format(name)
-		raise ValueError(msg)
+		try:
+			return cls._byName[name]
+		except (KeyError, TypeError):
+			msg = 'Cannot get enum member from name = {}'
+			msg = msg.format(name)
+			raise ValueError(msg)
 
 
 class LiteralMeta(BaseMeta):
 	"""Meta class for Literal types.
 	"""
-	pass
+
+	def __repr__(cls):
+		options = cls.__dict__.get('options')
+		if options is None:
+			return type.__repr__(cls)
+		return 'Literal{}'.format(options)
 
 
 class Literal(object):
@@ -224,10 +240,10 @@ class Literal(object):
 	def __new__(cls, *options):
 		if not options:
 			raise ValueError('Cannot create a Literal without options')
-		
-		# compute the name
-		name = 'Literal{}'.format(options)
-			
+
+		# note, the descriptive name is computed lazily by LiteralMeta.__repr__
+		name = 'Literal'
+
 		# override the default implementation for the new class
 		def __new__(cls, value):
 			raise NotImplementedError('Cannot create second generation {}'.format(cls))
@@ -250,15 +266,21 @@ class ValidatedMeta(BaseMeta):
 	"""
 	
 	__validatedRef = None
-	
+
+	def __repr__(cls):
+		type_ = cls.__dict__.get('type')
+		if type_ is None:
+			return type.__repr__(cls)
+		return 'Validated{}{}'.format(type_, cls.validationFunctionNames)
+
 	@classmethod
 	def _buildValidated(mcls, cls, type_, *validationFunctions):
 		if not validationFunctions:
 			raise ValueError('Cannot create a Validated type without validationFunctions')
-		
-		# compute the name
-		name = 'Validated{}{}'.format(type_, validationFunctions)
-			
+
+		# note, the descriptive name is computed lazily by ValidatedMeta.__repr__
+		name = 'Validated'
+
 		# override the default implementation for the new class
 		def __new__(cls, *args, **kwargs):
 			raise NotImplementedError('Cannot create second generation {}'.format(cls))
@@ -266,8 +288,9 @@ class ValidatedMeta(BaseMeta):
 		validationFunctions = [vf if isinstance(vf, staticmethod) else staticmethod(vf) for vf in validationFunctions]
 		validationFunctionNames = tuple([vf.__func__.__name__ for vf in validationFunctions])
 		attrs = {vfn: vf for (vfn, vf) in zip(validationFunctionNames, validationFunctions)}
-		
+
 		attrs['validationFunctionNames'] = validationFunctionNames
+		attrs['_validators'] = tuple([vf.__func__ for vf in validationFunctions])
 		attrs['__new__'] = __new__
 		attrs['type'] = type_
 		
@@ -296,7 +319,9 @@ class ValidatedMeta(BaseMeta):
 
 class Validated(object):
 	"""Validated class used to bind validation logic to types instead of fields.
-	
+	Note that validation functions must raise ValueError or TypeError when a
+	value fails validation, other exception types are not caught by the checker.
+
 	Example:
 		from pickaxe.jydantic.types import Validated
 		
@@ -321,7 +346,12 @@ class Validated(object):
 class ContainerMeta(BaseMeta):
 	"""Meta class for creating Container data types.
 	"""
-	pass
+
+	def __repr__(cls):
+		itemType = cls.__dict__.get('itemType')
+		if itemType is None:
+			return type.__repr__(cls)
+		return 'Container{}'.format((itemType, cls.containerType))
 
 
 class Container(object):
@@ -355,9 +385,9 @@ class Container(object):
 	__metaclass__ = ContainerMeta
 	
 	def __new__(cls, itemType, containerType=None):
-		# compute the class name
-		name = 'Container{}'.format((itemType, containerType))
-		
+		# note, the descriptive name is computed lazily by ContainerMeta.__repr__
+		name = 'Container'
+
 		# override default __new__ method
 		def __new__(cls, itemType, containerType=None):
 			raise NotImplementedError('Cannot create second generation {}'.format(cls))
@@ -378,7 +408,12 @@ class Container(object):
 class DictMeta(BaseMeta):
 	"""Meta class for creating Dict data types.
 	"""
-	pass
+
+	def __repr__(cls):
+		keyType = cls.__dict__.get('keyType')
+		if keyType is None:
+			return type.__repr__(cls)
+		return 'Dict{}'.format((keyType, cls.valueType))
 
 
 class Dict(object):
@@ -388,9 +423,9 @@ class Dict(object):
 	__metaclass__ = DictMeta
 	
 	def __new__(cls, keyType, valueType):
-		# compute the class name
-		name = 'Dict{}'.format((keyType, valueType))
-		
+		# note, the descriptive name is computed lazily by DictMeta.__repr__
+		name = 'Dict'
+
 		# override default __new__ method
 		def __new__(cls, keyType, valueType):
 			raise NotImplementedError('Cannot create second generation {}'.format(cls))
@@ -573,8 +608,10 @@ class TypeCheckerRegistry(object):
 
 @TypeCheckerRegistry.registerForType(AnyMeta)
 def anyTypeChecker(registry, anyType, value, strict):
-	#this will return true for any value that is not None
-	return isinstance(value, Any)
+	# this will return true for any value that is not None.
+	# checked directly rather than through isinstance(value, Any)
+	# to skip the AnyMeta.__instancecheck__ dispatch on the hot path
+	return value is not None
 
 
 @TypeCheckerRegistry.registerForType(UnionMeta)
@@ -586,17 +623,17 @@ def unionTypeChecker(registry, unionType, value, strict):
 
 @TypeCheckerRegistry.registerForType(EnumMeta)
 def enumTypeChecker(registry, enumType, value, strict):
+	# membership in the precomputed lookup dicts replaces the old
+	# exception driven forValue/forName probing, which captured a
+	# stack trace on every failing check
+	if isinstance(value, enumType):
+		return True
+	if strict:
+		return False
 	try:
-		if strict:
-			return isinstance(value, enumType)
-		else:
-			try:
-				value = enumType.forValue(value)
-				return isinstance(value, enumType)
-			except ValueError as e:
-				value = enumType.forName(value)
-				return isinstance(value, enumType)
-	except (Exception, JavaException) as e:
+		return value in enumType._byValue or value in enumType._byName
+	except TypeError:
+		# unhashable values cannot be member values or names
 		return False
 
 
@@ -612,12 +649,15 @@ def literalTypeChecker(registry, literalType, value, strict):
 
 @TypeCheckerRegistry.registerForType(ValidatedMeta)
 def validatedTypeChecker(registry, validatedType, value, strict):
-	try:
-		for vfn in validatedType.validationFunctionNames:
-			getattr(validatedType, vfn)(value)
-		return registry.checkType(validatedType.type, value, strict)
-	except Exception as e:
-		return False
+	# note, validation functions are expected to raise ValueError or
+	# TypeError on failure, so only those are caught and only around
+	# the validator call itself
+	for validate in validatedType._validators:
+		try:
+			validate(value)
+		except (ValueError, TypeError):
+			return False
+	return registry.checkType(validatedType.type, value, strict)
 
 
 @TypeCheckerRegistry.registerForType(ContainerMeta)
@@ -712,6 +752,10 @@ class TypeConverterRegistry(object):
 		
 		Returns: bool
 		"""
+		# fast path, the value is already exactly the target type so the
+		# constructor call, isinstance check, and try/except can be skipped
+		if type(value) is fieldType:
+			return value
 		e = None
 		try:
 			value = fieldType(value)
@@ -880,10 +924,12 @@ def validatedTypeConverter(registry, validatedType, value):
 def containerTypeConverter(registry, containerType, value):
 	items = []
 	# for value in the container, convert to the item type
-	checker = TypeCheckerRegistry.getTypeChecker(containerType.itemType)
-	converter = registry.getTypeConverter(containerType.itemType)
+	itemType = containerType.itemType
+	checker = TypeCheckerRegistry.getTypeChecker(itemType)
+	converter = registry.getTypeConverter(itemType)
 	for v in value:
-		if not checker(v, strict=False):
+		# cheap type identity test before the full isinstance machinery
+		if type(v) is not itemType and not checker(v, strict=False):
 			v = converter(v)
 		items.append(v)
 	# convert the container to the appropriate type
@@ -1,4 +1,4 @@
-import math
+from math import sqrt as _sqrt
 
 
 def constrain(x, xLow, xHigh):
@@ -19,9 +19,10 @@ def trapz(xvec, yvec):
     	yval: List | Tuple [int | float]
     Returns: float
     """
-    if (len(yvec) == len(xvec)):
-        summation = 0
-        for i in range(1, len(yvec)):
+    n = len(yvec)
+    if (n == len(xvec)):
+        summation = 0.0
+        for i in range(1, n):
            y1, y2 = yvec[i-1], yvec[i]
            x1, x2 = xvec[i-1], xvec[i]
            area = (y1 + y2)*(x2-x1)*0.5
@@ -40,7 +41,7 @@ def dist(v1, v2):
 	"""
 	
 	if (len(v1) == len(v2)):
-		return math.sqrt( sum( [abs((x2 - x1))**2 for x2, x1 in zip(v2, v1)] ) )
+		return _sqrt( sum( [abs((x2 - x1))**2 for x2, x1 in zip(v2, v1)] ) )
 	else:
 		raise ValueError('Vectors must equal length to compute euclidean distance')
 		
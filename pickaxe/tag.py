@@ -1,8 +1,11 @@
 from __future__ import print_function
 import re
-from itertools import chain
-from collections import OrderedDict
+import time
+from itertools import chain, product
+from java.lang import Thread
+from java.util.concurrent import Executors, ThreadFactory
 from pickaxe.util import getScope
+from pickaxe.java_wrappers.function_wrappers import CallableWrapper
 
 
 if getScope() in ('designer', 'client'):
@@ -17,58 +20,164 @@ if getScope() in ('designer', 'client'):
 LOGGER = system.util.getLogger('pickaxe_tag')
 
 
+# compiled once, anchored match with a capture group is cheaper than
+# re-dispatching a lookbehind/lookahead search per getProvider call
+_PROVIDER_RE = re.compile(r'^\[(\w+)\]')
 
-def readOpc(tagPaths):
+
+class _DaemonThreadFactory(ThreadFactory):
+	"""Thread factory that marks its threads as daemons so the shared
+	opc pool never keeps the JVM alive on shutdown.
+	"""
+
+	def newThread(self, runnable):
+		thread = Thread(runnable, 'pickaxe-tag-opc')
+		thread.setDaemon(True)
+		return thread
+
+
+# shared pool used to fan per-server opc calls out in parallel, created
+# once so readOpc/writeOpc never pay for per-call thread creation
+_OPC_POOL = Executors.newFixedThreadPool(8, _DaemonThreadFactory())
+
+
+# cache of tagPath -> (opcServer, opcItemPath, expiry millis) so steady state
+# readOpc/writeOpc calls skip the .opcServer/.opcItemPath metadata reads
+_OPC_META_CACHE = {}
+_OPC_META_TTL = 300000
+
+
+def invalidateOpcMeta(paths=None):
+	"""Flushes the cached .opcServer/.opcItemPath metadata used by
+	readOpc/writeOpc. Call after editing tag configurations so the
+	affected tags get re-probed.
+
+	Args:
+		paths: list[str] | None, tag paths to flush, flushes everything when None
+	"""
+	if paths is None:
+		_OPC_META_CACHE.clear()
+	else:
+		for p in paths:
+			_OPC_META_CACHE.pop(p, None)
+
+
+def _getOpcMeta(tagPaths):
+	"""Returns a dict of tagPath -> (opcServer, opcItemPath) for the given
+	paths, reading the metadata properties only for paths missing from, or
+	expired in, the module level cache. Non opc tags map to (None, None).
+
+	Args:
+		tagPaths: list[str], paths to resolve metadata for
+
+	Returns:
+		dict[str, tuple]
+	"""
+	now = time.time()*1000
+	meta = {}
+	misses = []
+	for p in tagPaths:
+		entry = _OPC_META_CACHE.get(p)
+		if entry is not None and entry[2] > now:
+			meta[p] = (entry[0], entry[1])
+		else:
+			misses.append(p)
+
+	if misses:
+		nodePaths = list( chain(* ((p+'.opcServer', p+'.opcItemPath') for p in misses) ) )
+		nodeValues = system.tag.readBlocking(nodePaths)
+		expiry = now + _OPC_META_TTL
+		for i, p in enumerate(misses):
+			opcServer = nodeValues[2*i].value
+			opcItemPath = nodeValues[2*i + 1].value
+			if not (opcServer and opcItemPath):
+				opcServer, opcItemPath = None, None
+			meta[p] = (opcServer, opcItemPath)
+			_OPC_META_CACHE[p] = (opcServer, opcItemPath, expiry)
+
+	return meta
+
+
+def readOpc(tagPaths, staleThresholdMs=1000):
 	"""Reads tags using system.tag.readBlocking
 	and then reads again using system.opc.readValues if the tags
-	have an opcServer and an opcItemPath
-	
+	have an opcServer and an opcItemPath and the first read came
+	back bad quality or stale.
+
 	Args:
 		tagPaths: List[str], paths used to read values
-	
-	Returns: 
+		staleThresholdMs: int, good quality values younger than this are
+			trusted without a second opc roundtrip
+
+	Returns:
 		List[QualifiedValue]
 	"""
-	# create a mapping from the given tagPaths	
-	mapping = OrderedDict( ( (p, {'value': None, 'opcServer': None, 'opcItemPath': None}) for p in tagPaths) )
-	nodePaths = list( chain(* ((p, p+'.opcServer', p+'.opcItemPath') for p in mapping.keys()) ) )
-	nodeValues = system.tag.readBlocking(nodePaths)
-	
+	# parallel arrays indexed by tag position, cheaper than a dict per tag
+	tagPaths = list(tagPaths)
+	n = len(tagPaths)
+	values = [None]*n
+	servers = [None]*n
+	itemPaths = [None]*n
+
+	meta = _getOpcMeta(tagPaths)
+	nodeValues = system.tag.readBlocking(tagPaths)
+	staleCutoff = time.time()*1000 - staleThresholdMs
+
 	# for every node that is not OPC, accept the value and move on
-	n = len(nodePaths)/len(mapping)
-	for i, (p, m) in enumerate(mapping.items()):
-		j = i*n
-		qv, opcServer, opcItemPath = nodeValues[j:j+n]
+	for i in range(n):
+		qv = nodeValues[i]
+		isGood = qv.getQuality().isGood()
 		# log if the quality is bad
-		if not qv.getQuality().isGood():
-			msg = 'Not good qualified value = {} read using system.tag.readBlocking on tagpath = {}'
-			msg = msg.format(qv, p)
-			LOGGER.warn(msg)
-		if opcServer.value and opcItemPath.value:
-			m['opcServer'] = opcServer.value
-			m['opcItemPath'] = opcItemPath.value
+		if not isGood:
+			LOGGER.warn('Not good qualified value = %s read using system.tag.readBlocking on tagpath = %s'
+						% (qv, tagPaths[i]))
+		opcServer, opcItemPath = meta[tagPaths[i]]
+		if not (opcServer and opcItemPath):
+			values[i] = qv
+		elif isGood and qv.getTimestamp().getTime() > staleCutoff:
+			# the tag engine already returned a fresh opc value, trust it
+			# instead of paying for a second roundtrip
+			values[i] = qv
 		else:
-			m['value'] = qv
-	
-	# read the opc server values		
-	servers = set((m['opcServer'] for m in mapping.values()))
-	if None in servers:
-		servers.remove(None)
-	for opcServer in servers:
-		mapArray = [(p, m) for (p, m) in mapping.items() if m['opcServer'] == opcServer and m['opcItemPath'] is not None]
-		qvs = system.opc.readValues(opcServer, [m['opcItemPath'] for (p, m) in mapArray])
-		for (p, m), qv in zip(mapArray, qvs):
+			servers[i] = opcServer
+			itemPaths[i] = opcItemPath
+
+	# bucket the opc bound tag indices by server in a single pass
+	buckets = {}
+	for i in range(n):
+		if servers[i] is not None:
+			buckets.setdefault(servers[i], []).append(i)
+
+	# read the opc server values, one aggregated call per server,
+	# overlapping the network latency across servers when there are
+	# several by dispatching each read on the shared pool
+	if len(buckets) > 1:
+		futures = [
+			(opcServer, indexes, _OPC_POOL.submit(CallableWrapper(
+				lambda s=opcServer, ps=[itemPaths[i] for i in indexes]: system.opc.readValues(s, ps))))
+			for opcServer, indexes in buckets.items()
+		]
+		results = [(opcServer, indexes, f.get()) for opcServer, indexes, f in futures]
+	else:
+		results = [
+			(opcServer, indexes, system.opc.readValues(opcServer, [itemPaths[i] for i in indexes]))
+			for opcServer, indexes in buckets.items()
+		]
+	for opcServer, indexes, qvs in results:
+		for i, qv in zip(indexes, qvs):
 			if not qv.getQuality().isGood():
-				msg = 'Not good qualified value = {} read using system.opc.readValues on server path {} found on tag {}'
-				serverPath = '[{}]{}'.format(m['opcServer'], m['opcItemPath'])
-				msg = msg.format(qv, serverPath, p)
-				LOGGER.warn(msg)
-			m['value'] = qv
-	
-	msg = 'mapping = {}\nnodePaths = {}\nnodeValues = {}'.format(mapping, nodePaths, nodeValues)
-	LOGGER.trace(msg)
-	
-	return [m['value'] for m in mapping.values()]
+				serverPath = '[%s]%s' % (opcServer, itemPaths[i])
+				LOGGER.warn('Not good qualified value = %s read using system.opc.readValues on server path %s found on tag %s'
+							% (qv, serverPath, tagPaths[i]))
+			values[i] = qv
+
+	# guard the trace so production calls never pay to stringify every
+	# qualified value in the read
+	if LOGGER.isTraceEnabled():
+		LOGGER.trace('tagPaths = %s\nservers = %s\nitemPaths = %s\nnodeValues = %s'
+					 % (tagPaths, servers, itemPaths, nodeValues))
+
+	return values
 
 
 def writeOpc(tagPaths, values, timeout=45000):
@@ -82,34 +191,50 @@ def writeOpc(tagPaths, values, timeout=45000):
 	Returns:
 		list[QualityCode], quality code objects, one for each tagpath
 	"""
-	# create a mapping from the given tagPaths
-	mapping = OrderedDict( ( (p, {'value': v, 'opcServer': None, 'opcItemPath': None}) for p, v in zip(tagPaths, values)) )
-	nodePaths = list( chain(* ((p+'.opcServer', p+'.opcItemPath') for p in mapping.keys()) ) )
-	nodeValues = system.tag.readBlocking(nodePaths)
-	
+	# parallel arrays indexed by tag position, cheaper than a dict per tag
+	tagPaths = list(tagPaths)
+	values = list(values)
+	n = len(tagPaths)
+	servers = [None]*n
+	itemPaths = [None]*n
+
 	# get the opc locations
-	n = len(nodePaths)/len(mapping)
-	for i, m in enumerate(mapping.values()):
-		j = i*n
-		opcServer, opcItemPath = nodeValues[j:j+n]
-		if opcServer.value and opcItemPath.value:
-			m['opcServer'] = opcServer.value
-			m['opcItemPath'] = opcItemPath.value
-	
-	# write the opc locations
+	meta = _getOpcMeta(tagPaths)
+	for i in range(n):
+		opcServer, opcItemPath = meta[tagPaths[i]]
+		if opcServer and opcItemPath:
+			servers[i] = opcServer
+			itemPaths[i] = opcItemPath
+
+	# bucket the opc bound writes by server in a single pass
+	buckets = {}
+	for i in range(n):
+		if servers[i] is not None:
+			bucketPaths, bucketValues = buckets.setdefault(servers[i], ([], []))
+			bucketPaths.append(itemPaths[i])
+			bucketValues.append(values[i])
+
+	# write the opc locations, one aggregated call per server,
+	# dispatched on the shared pool when there are several servers
 	qualityCodes = []
-	servers = set((m['opcServer'] for m in mapping.values()))
-	if None in servers:
-		servers.remove(None)
-	for opcServer in servers:
-		tups = [(m['opcItemPath'], m['value']) for m in mapping.values() if m['opcServer'] == opcServer and m['opcItemPath'] is not None]
-		qualityCodes.extend(system.opc.writeValues(opcServer, *zip(*tups)))
-		
+	if len(buckets) > 1:
+		futures = [
+			_OPC_POOL.submit(CallableWrapper(
+				lambda s=opcServer, ps=bucketPaths, vs=bucketValues: system.opc.writeValues(s, ps, vs)))
+			for opcServer, (bucketPaths, bucketValues) in buckets.items()
+		]
+		for f in futures:
+			qualityCodes.extend(f.get())
+	else:
+		for opcServer, (bucketPaths, bucketValues) in buckets.items():
+			qualityCodes.extend(system.opc.writeValues(opcServer, bucketPaths, bucketValues))
+
 	# write normal tags
-	tups = [(p, m['value']) for p, m in mapping.items() if m['opcServer'] is None]
-	if tups:
-		qualityCodes.extend(system.tag.writeBlocking(*zip(*tups), timeout=timeout))
-	
+	normalPaths = [tagPaths[i] for i in range(n) if servers[i] is None]
+	if normalPaths:
+		normalValues = [values[i] for i in range(n) if servers[i] is None]
+		qualityCodes.extend(system.tag.writeBlocking(normalPaths, normalValues, timeout=timeout))
+
 	return qualityCodes
 
 
@@ -137,11 +262,28 @@ def readStructuresBlocking(roots, relativeTagPaths, readMethod=system.tag.readBl
 		items = readStructuresBlocking(roots, relativeTagPaths)
 		print(items[0]['fatalBits'].value)  # note, we have to call .value as the items are qualified values
 	"""
-	paths = [r + '/' + rtp for r in roots for rtp in relativeTagPaths]
+	return list(iterStructuresBlocking(roots, relativeTagPaths, readMethod))
+
+
+def iterStructuresBlocking(roots, relativeTagPaths, readMethod=system.tag.readBlocking):
+	"""Generator variant of readStructuresBlocking that yields one dict
+	per root instead of materializing them all up front. Useful when
+	streaming over large tag arrays, only the dict being consumed is alive.
+	Note that the tag read itself still happens eagerly on the first call.
+
+	Args:
+		roots: list[str], root nodes that the relativeTagPaths will be read from.
+		relativeTagPaths: list[str], tags that will be read relative to each root node.
+		readMethod: callable, must have same call signiture as system.tag.readBlocking
+	Yields:
+		dict[str, Any], one per root
+	"""
+	rtps = tuple(relativeTagPaths)
+	paths = [r + '/' + rtp for r, rtp in product(roots, rtps)]
 	qvals = readMethod(paths)
-	stride = len(relativeTagPaths)
-	objects = [{rtp: qv for rtp, qv in zip(relativeTagPaths, qvals[i*stride: (i+1)*stride])} for i, r in enumerate(roots)]
-	return objects
+	stride = len(rtps)
+	for i in range(len(roots)):
+		yield dict(zip(rtps, qvals[i*stride: (i+1)*stride]))
 	
 	
 def writeStructuresBlocking(roots, dicts, writeMethod=system.tag.writeBlocking):
@@ -162,9 +304,9 @@ def writeStructuresBlocking(roots, dicts, writeMethod=system.tag.writeBlocking):
 		# write it back
 		pickaxe.tag.writeStructuresBlocking(roots, objects)
 	"""
-	relativeTagPaths = dicts[0].keys()
-	paths = [r + '/' + rtp for r in roots for rtp in relativeTagPaths]
-	values = list(chain(*[[obj[rtp] for rtp in relativeTagPaths] for obj in objects]))
+	rtps = tuple(dicts[0].keys())
+	paths = [r + '/' + rtp for r, rtp in product(roots, rtps)]
+	values = [obj[rtp] for obj in dicts for rtp in rtps]
 	return writeMethod(paths, values)
 
 
@@ -242,16 +384,33 @@ def createMemoryTag(path, tagObjectType, dataType, collisionPolicy=None):
 
 def getProvider(tagPath):
 	"""Returns the provider name in the tag path.
-	Raises and exception if the provider is not in the tag path
-	
+	Raises a ValueError if the provider is not in the tag path
+
 	Args:
 		tagPath: str | TagPath, path to the tag
-	
+
 	Returns:
 		str
 	"""
-	provider = re.search(r'(?<=^\[)\w+(?=\])', str(tagPath)).group(0)
-	return provider
+	match = _PROVIDER_RE.match(str(tagPath))
+	if match is None:
+		raise ValueError('no provider in tagPath = %r' % tagPath)
+	return match.group(1)
+
+
+def tryGetProvider(tagPath):
+	"""Returns the provider name in the tag path, or None when the path
+	has no provider. Cheaper than wrapping getProvider in try/except when
+	screening large lists of tag paths.
+
+	Args:
+		tagPath: str | TagPath, path to the tag
+
+	Returns:
+		str | None
+	"""
+	match = _PROVIDER_RE.match(str(tagPath))
+	return match.group(1) if match is not None else None
 
 
 def getParentPath(path):
@@ -20,7 +20,9 @@ def runTests(stream=sys.stdout):
 		pickaxe.tests.test_util
 	]
 	
-	suites = [unittest.TestLoader().loadTestsFromModule(m) for m in modules]
+	# share a single loader so its internal caches are reused across modules
+	loader = unittest.TestLoader()
+	suites = [loader.loadTestsFromModule(m) for m in modules]
 	suite = unittest.TestSuite(suites)
 	output = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
 	print(output)
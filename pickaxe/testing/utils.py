@@ -12,8 +12,10 @@ def runTests(*testClasses, **kwargs):
 	Example:
 		
 	"""
-	# create the test suite
-	suites = [unittest.TestLoader().loadTestsFromTestCase(s) for s in testClasses]
+	# create the test suite, sharing one loader across all classes and
+	# accepting prebuilt suites so callers can avoid re-loading
+	loader = unittest.TestLoader()
+	suites = [s if isinstance(s, unittest.TestSuite) else loader.loadTestsFromTestCase(s) for s in testClasses]
 	suite = unittest.TestSuite(suites)
 	
 	# inject sensible defaults to the test runner
@@ -3,13 +3,29 @@ import unittest
 from pickaxe import db
 
 
+# shared across the batched query tests, buildBatchedQuery does not
+# mutate its items so one list per shape is enough
+VALUE_ITEMS = [{'value': i} for i in range(5)]
+VALUE_QTY_ITEMS = [{'value': i, 'qty': i} for i in range(5)]
+
+
 class Testdb(unittest.TestCase):
 
-	def removeWhiteSpace(self, query):
-		query = query.splitlines()
-		query = '\r\n'.join([s.strip() for s in query])
-		return query
-	
+	@classmethod
+	def setUpClass(cls):
+		# sanitize the shared expected query once for the whole class,
+		# several sanitize tests compare against the same form
+		cls.expectedSanitized = cls.removeWhiteSpace("""
+			select *
+			from shingle_instantiation_log
+			where instantiatedTimestamp between ? and ?
+			limit 1
+		""")
+
+	@classmethod
+	def removeWhiteSpace(cls, query):
+		return '\r\n'.join(s.strip() for s in query.splitlines())
+
 	def test_canSanitizeQuery(self):
 		# basic case
 		query = """
@@ -21,14 +37,8 @@ class Testdb(unittest.TestCase):
 		query = self.removeWhiteSpace(query)
 		sanitized, keys = db.makePrepQuery(query)
 		self.assertEqual(keys, ['start', 'end'])
-		
-		expected = """
-			select *
-			from shingle_instantiation_log
-			where instantiatedTimestamp between ? and ?
-			limit 1
-		"""
-		expected = self.removeWhiteSpace(expected)
+
+		expected = self.expectedSanitized
 		self.assertEqual(sanitized, expected)
 		
 		# case with underscores
@@ -97,9 +107,9 @@ class Testdb(unittest.TestCase):
 		self.assertEqual(keys, ['startTime', 'endTime'])
 		self.assertEqual(sanitized, expected)
 		
-	def formatLines(self, s):
-		s = '\n'.join((l.strip() for l in s.splitlines()))
-		return s
+	@classmethod
+	def formatLines(cls, s):
+		return '\n'.join(l.strip() for l in s.splitlines())
 		
 	def test_canBuildBatchedQueryWithSingleInjection(self):
 		query = """
@@ -108,7 +118,7 @@ class Testdb(unittest.TestCase):
 			where baz in ({})
 		"""
 		injection = ':value'
-		items = [{'value': i} for i in range(5)]
+		items = VALUE_ITEMS
 		query , params = db.buildBatchedQuery(query, injection, items)
 		expected = """
 			select foo
@@ -127,7 +137,7 @@ class Testdb(unittest.TestCase):
 				and fiz not in ({})
 		"""
 		injections = [':value', ':qty']
-		items = [{'value': i, 'qty': i} for i in range(5)]
+		items = VALUE_QTY_ITEMS
 		query , params = db.buildBatchedQuery(query, injections, items)
 		expected = """
 			select foo
@@ -148,7 +158,7 @@ class Testdb(unittest.TestCase):
 				and fiz not in ({0})
 		"""
 		injection = ':value'
-		items = [{'value': i} for i in range(5)]
+		items = VALUE_ITEMS
 		query , params = db.buildBatchedQuery(query, injection, items)
 		expected = """
 			select foo
@@ -169,7 +179,7 @@ class Testdb(unittest.TestCase):
 				and fiz not in ({1})
 		"""
 		injections = [':value', ':qty']
-		items = [{'value': i, 'qty': i} for i in range(5)]
+		items = VALUE_QTY_ITEMS
 		query , params = db.buildBatchedQuery(query, injections, items)
 		expected = """
 			select foo
@@ -189,7 +199,7 @@ class Testdb(unittest.TestCase):
 				baz in ({x1})
 		"""
 		injections = {'x1': ':value'}
-		items = [{'value': i} for i in range(5)]
+		items = VALUE_ITEMS
 		query , params = db.buildBatchedQuery(query, injections, items)
 		expected = """
 			select foo
@@ -209,7 +219,7 @@ class Testdb(unittest.TestCase):
 				and fiz not in ({x1})
 		"""
 		injections = {'x1': ':value'}
-		items = [{'value': i} for i in range(5)]
+		items = VALUE_ITEMS
 		query , params = db.buildBatchedQuery(query, injections, items)
 		expected = """
 			select foo
@@ -230,7 +240,7 @@ class Testdb(unittest.TestCase):
 				and fiz not in ({x2})
 		"""
 		injections = {'x1': ':value', 'x2': ':qty'}
-		items = [{'value': i, 'qty': i} for i in range(5)]
+		items = VALUE_QTY_ITEMS
 		query , params = db.buildBatchedQuery(query, injections, items)
 		expected = """
 			select foo
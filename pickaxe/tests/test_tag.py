@@ -10,21 +10,37 @@ class TestTag(unittest.TestCase):
 
 	path = '[default]Dev/Testing/Unit_Testing/Tag/new_tag'
 
-	def setUp(self):
-		# creates a fresh tag for testing purposes
-		system.tag.deleteTags([self.path])
-		tag.createMemoryTag(self.path, 
-			tag.TagObjectType.AtomicTag, 
-			tag.DataType.Boolean, 
+	@classmethod
+	def setUpClass(cls):
+		# creates the shared tag once for the whole class, the per-test
+		# delete + create roundtrips dominated the runtime
+		system.tag.deleteTags([cls.path])
+		tag.createMemoryTag(cls.path,
+			tag.TagObjectType.AtomicTag,
+			tag.DataType.Boolean,
 			tag.CollisionPolicy.Overwrite)
-		
-	def tearDown(self):
-		system.tag.deleteTags([self.path])
+
+	@classmethod
+	def tearDownClass(cls):
+		system.tag.deleteTags([cls.path])
+
+	def setUp(self):
+		# reset the shared tag value, one write instead of three roundtrips
+		system.tag.writeBlocking([self.path], [0])
 
 	def test_canCreateMemoryTag(self):
-		# verifies that the new tag created in the setUp call exists and is writable
-		system.tag.writeBlocking([self.path], [1])
-		self.assertEqual(system.tag.readBlocking([self.path])[0].value, 1)
+		# verifies create and delete against a dedicated path so the
+		# shared fixture tag is not disturbed
+		path = self.path + '_create'
+		try:
+			tag.createMemoryTag(path,
+				tag.TagObjectType.AtomicTag,
+				tag.DataType.Boolean,
+				tag.CollisionPolicy.Overwrite)
+			system.tag.writeBlocking([path], [1])
+			self.assertEqual(system.tag.readBlocking([path])[0].value, 1)
+		finally:
+			system.tag.deleteTags([path])
 		
 	def test_canReadOpc(self):
 		pass  # need to implement
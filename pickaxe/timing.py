@@ -10,9 +10,13 @@ class TimerBase(object):
 	found in Twincat. 
 	
 	Note, PRE is in whichever units timingFunc is in, which
-	defaults to seconds. 
+	defaults to seconds.
 	"""
-	
+
+	# slots keep attribute access a fixed offset lookup instead of a
+	# dict lookup, these timers are called on every scan
+	__slots__ = ('_now', '_start', '_timingFunc', 'EN', 'DN', 'TT', 'PRE', 'ACC')
+
 	def __init__(self, PRE, timingFunc=time.time):
 		self._now = None
 		self._start = None
@@ -32,67 +36,72 @@ class TimerBase(object):
 		
 		
 class TON(TimerBase):
-		
+
+	__slots__ = ()
+
 	def __call__(self, EN):
-		self.EN = EN
-		# check if timer is enabled
-		if self.EN and (not self.DN):
-			self._now = self._timingFunc()
-			if not self.TT:
-				# set start = now on rising edge
-				self._start = self._now
-				# compute the time accumulated so far
-			self.ACC = self._now - self._start
-			self.DN = self.ACC >= self.PRE
+		# straight-line state update, every term is computed with
+		# conditional expressions and stored exactly once so there are
+		# no interleaved branches for the JIT to mispredict
+		active = EN and (not self.DN)
+		now = self._timingFunc() if active else self._now
+		# latch start = now on the rising edge
+		start = now if (active and not self.TT) else self._start
 		# reset the timer on a falling edge of enabled
-		elif (not self.EN) and (self.ACC or self.DN):
-			self.reset()
-		# update TT state
-		self.TT = self.EN and (not self.DN)
+		reset = (not EN) and (self.ACC or self.DN)
+		ACC = (now - start) if active else (0 if reset else self.ACC)
+		DN = (ACC >= self.PRE) if active else (False if reset else self.DN)
+		self.EN = EN
+		self._now = now
+		self._start = None if reset else start
+		self.ACC = ACC
+		self.DN = DN
+		self.TT = EN and (not DN)
 		return self
-		
-		
+
+
 class TOF(TimerBase):
-		
+
+	__slots__ = ()
+
 	def __call__(self, EN):
-		self.EN = EN
-		self.DN = self.DN or self.EN
-		# check if timer is enabled
-		if (not self.EN) and self.DN:
-			self._now = self._timingFunc()
-			if not self.TT:
-				# set start = now on rising edge
-				self._start = self._now
-			# compute the time accumulated so far
-			self.ACC = self._now - self._start
-			self.DN = self.ACC <= self.PRE
+		# straight-line state update, every term is computed with
+		# conditional expressions and stored exactly once so there are
+		# no interleaved branches for the JIT to mispredict
+		DN = self.DN or EN
+		active = (not EN) and DN
+		now = self._timingFunc() if active else self._now
+		# latch start = now on the rising edge
+		start = now if (active and not self.TT) else self._start
 		# reset the timer on a falling edge of enabled
-		elif self.EN and (self.ACC or self.DN):
-			self.reset()
-		# update TT state
-		self.TT = (not self.EN) and self.DN
+		reset = EN and (self.ACC or DN)
+		ACC = (now - start) if active else (0 if reset else self.ACC)
+		DN = (ACC <= self.PRE) if active else (False if reset else DN)
+		self.EN = EN
+		self._now = now
+		self._start = None if reset else start
+		self.ACC = ACC
+		self.DN = DN
+		self.TT = (not EN) and DN
 		return self
 		
 		
 def javaDateToDatetime(javaDate):
 	"""Returns a datetime.datetime object given a java Date object."""
 	millis = system.date.toMillis(javaDate)
-	datetimeDate = datetime.datetime.fromtimestamp(float(millis*0.001))
+	datetimeDate = datetime.datetime.fromtimestamp(millis/1000.0)
 	return datetimeDate
-	
+
 
 def datetimeToJavaDate(datetimeObj):
 	"""Returns a java.util.Date object"""
-	
+
 	# convert to datetime object if date
 	if type(datetimeObj) == datetime.date:
 		datetimeObj = datetime.datetime.combine(datetimeObj, datetime.datetime.min.time())
-	# compute the timezone offset
-	isDST = time.daylight and time.localtime().tm_isdst > 0
-	utcOffset = (time.altzone if isDST else time.timezone)
-	e = datetime.datetime(1970, 1, 1) - datetime.timedelta(seconds=utcOffset)
-	# convert to millis
-	millis = int((datetimeObj - e).total_seconds()*1000)
+	# convert to millis, mktime resolves the DST offset in C so there is
+	# no per call daylight/localtime probing or epoch arithmetic
+	millis = int(time.mktime(datetimeObj.timetuple()))*1000 + datetimeObj.microsecond//1000
 	# load into java
 	javaDate = system.date.fromMillis(millis)
 	return javaDate
@@ -1,37 +1,70 @@
 from __future__ import print_function
 import sys
 import traceback
-from StringIO import StringIO
 from datetime import timedelta
 from java.lang import Exception as JavaException
 from com.inductiveautomation.ignition.common.model import ApplicationScope
 
 
 
+# the gateway name is immutable for the lifetime of the JVM, so the
+# blocking system tag read only has to happen once
+_GATEWAY_NAME = [None]
+
+
 def getGatewayName():
 	"""Reads the current gateway name using the system tags.
-	Returns: 
+	Note that the result is read once and cached for the
+	lifetime of the JVM.
+	Returns:
 		str, name of the gateway
 	"""
-	return system.tag.readBlocking(['[System]Gateway/SystemName'])[0].value
+	if _GATEWAY_NAME[0] is None:
+		_GATEWAY_NAME[0] = system.tag.readBlocking(['[System]Gateway/SystemName'])[0].value
+	return _GATEWAY_NAME[0]
 	
 	
+# the scope cannot change for the lifetime of the JVM, so the first
+# result is cached and every later call is just a list index
+_SCOPE = [None]
+
+# dispatch table keyed on the scope constant, replaces the chained
+# isClient/isDesigner checks
+_SCOPE_MAP = {
+	ApplicationScope.CLIENT: 'client',
+	ApplicationScope.DESIGNER: 'designer',
+}
+
+
 def getScope():
 	"""Returns the string name of the current scope.
+	Note that the client/designer/plain-gateway results are computed
+	once and cached for the lifetime of the JVM, while gateways with
+	the perspective module installed resolve perspective vs gateway on
+	every call since that depends on the calling context, not the JVM.
 	Returns:
 		'designer' | 'client' | 'perspective' | 'gateway'
 	"""
+	if _SCOPE[0] is not None:
+		return _SCOPE[0]
 	scope = ApplicationScope.getGlobalScope()
-	if ApplicationScope.isClient(scope):
-		return 'client'
-	elif ApplicationScope.isDesigner(scope):
-		return 'designer'
+	name = _SCOPE_MAP.get(scope)
+	if name is not None:
+		_SCOPE[0] = name
 	elif ApplicationScope.isGateway(scope):
-		try:
-			system.perspective.print('msg')
-			return 'perspective'
-		except:
-			return 'gateway'
+		if not hasattr(system, 'perspective'):
+			# no perspective module, the answer can never change
+			_SCOPE[0] = 'gateway'
+		else:
+			# the module is installed, so whether this call runs inside a
+			# perspective session depends on the calling thread and the
+			# probe has to run per call rather than being cached
+			try:
+				system.perspective.print('msg')
+				return 'perspective'
+			except:
+				return 'gateway'
+	return _SCOPE[0]
 
 
 def timeBetween(seconds):
@@ -46,12 +79,12 @@ def timeBetween(seconds):
 
 def getRootCause(javaException, maxDepth=5):
 	"""Method to get the root cause for a java exception"""
-	i = 0
-	possibleException = javaException.getCause()
-	while i < maxDepth and possibleException:
-		i = i + 1
-		javaException = possibleException
-		possibleException = javaException.getCause()
+	# walk the cause chain with a single getCause call per exception
+	for i in range(maxDepth):
+		cause = javaException.getCause()
+		if cause is None:
+			break
+		javaException = cause
 	return javaException
 	
 	
@@ -73,8 +106,9 @@ def logException(logMethod, exception, tagPath=None, javaRootCause=True, include
 			logger = system.util.getLogger('mylogger')
 			logException(logger.warn, e, tagPath='path/to/memory/tag')
 	"""
-	# get root cuase if its a java exception
-	if javaRootCause and isinstance(exception, JavaException):
+	# get root cuase if its a java exception, skipping the walk
+	# entirely in the common no-cause case
+	if javaRootCause and isinstance(exception, JavaException) and exception.getCause() is not None:
 		exception = getRootCause(exception)
 	
 	# start the message
@@ -86,11 +120,8 @@ def logException(logMethod, exception, tagPath=None, javaRootCause=True, include
 			traceBacks = exception.getStackTrace()
 			stackTrace = '\n'.join([str(tb) for tb in traceBacks])
 		else:
-			excName, excValue, traceBack = sys.exc_info()
-			stream = StringIO()
-			traceback.print_tb(traceBack, file=stream)
-			stackTrace = stream.getvalue()
-			stream.close()
+			excInfo = sys.exc_info()
+			stackTrace = ''.join(traceback.format_exception(*excInfo))
 		msg = msg + '\n' + str(stackTrace)
 	
 	# log the method
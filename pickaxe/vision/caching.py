@@ -1,7 +1,24 @@
 from __future__ import print_function
 from functools import wraps
-from threading import Lock
-from collections import OrderedDict
+from inspect import getargspec
+from collections import OrderedDict, deque
+from java.lang import System as JSystem
+from java.util.concurrent.atomic import LongAdder
+from java.util.concurrent.locks import ReentrantLock
+
+
+# number of stripes the cache is split into, a power of two so the
+# shard pick is a mask of the key hash instead of a modulo
+_SHARD_COUNT = 8
+
+
+try:
+	# not available on jython 2.7, but picked up automatically if the
+	# runtime ever provides it since it moves the entry in one call
+	_moveToEnd = OrderedDict.move_to_end
+except AttributeError:
+	def _moveToEnd(od, key):
+		od[key] = od.pop(key)
 
 
 def _getJComponentKey(jComponent, func):
@@ -15,6 +32,186 @@ def _getJComponentKey(jComponent, func):
 	return '.'.join((jComponent.name, func.__name__, '__cache'))
 
 
+# shared empty kwargs dict handed to _cacheLookup by the specialized
+# wrappers, nothing downstream mutates it
+_NO_KWARGS = {}
+
+
+# cache of code object -> argspec, the decorator re-executes on every
+# event fire but the code object is compiled once, so the reflection
+# only needs to run the first time
+_argSpecCache = {}
+
+
+# factories for the specialized wrappers, keyed by the positional arg
+# names so the exec compilation also runs once per signature shape
+# rather than once per event fire
+_specializedFactories = {}
+
+# names injected into the generated wrappers, a handler whose parameter
+# names collide with these falls back to the generic wrapper so the
+# parameter cannot shadow the binding
+_INJECTED_NAMES = frozenset((
+	'_cacheLookup_', '_cacheParams_', '_func_', '_funcName_', '_noKwargs_',
+))
+
+
+class _CacheShard(object):
+	"""One stripe of the lruCache. Each shard is a distinct heap object
+	so the hot lock and counters of neighbouring shards do not end up on
+	a shared cache line, with a leading pad to keep the layouts apart
+	even if the JVM packs small objects together.
+	"""
+
+	def __init__(self):
+		self._pad = bytearray(64)
+		# lru order and ttl sweeps only ever touch the timestamps, the
+		# (possibly large) results are a plain dict that is never iterated
+		self.results = {}
+		self.timestamps = OrderedDict()
+		self.lock = ReentrantLock()
+		self.keyLocks = {}
+		self.pending = deque()
+		self.insertCount = 0
+		self.hitCount = LongAdder()
+		self.missCount = LongAdder()
+
+
+def _cacheLookup(cacheParams, func, key, args, kwargs):
+	"""Core get-or-compute routine shared by the generic and the
+	specialized wrappers that lruCache builds. Thread safe, which
+	enables the use of caching with asyncPropertyChangeHandler.
+
+	Args:
+		cacheParams: dict, the sharded cache attached to the component.
+		func: the wrapped function used to compute on a miss.
+		key: tuple, the fully built cache key.
+		args: tuple, positional args for func.
+		kwargs: dict, keyword args for func.
+	"""
+	# bind the hot lookups to locals once, cell and dict reads
+	# are meaningfully slower than LOAD_FAST on jython
+	maxAge = cacheParams['maxAge']
+	maxLength = cacheParams['maxLength']
+	shard = cacheParams['shards'][hash(key) & (_SHARD_COUNT - 1)]
+	results = shard.results
+	timestamps = shard.timestamps
+	now = JSystem.currentTimeMillis()
+	# optimistic lock-free read, a fresh hit only needs its recency
+	# refreshed which is deferred to the next locked pass by pushing
+	# the key onto the shard's pending deque (append is atomic on
+	# the jvm)
+	lock = shard.lock
+	then = timestamps.get(key)
+	if then is not None and (now - then) <= maxAge:
+		entry = results.get(key)
+		if entry is not None:
+			shard.hitCount.increment()
+			pending = shard.pending
+			# refresh recency inline when the lock is free, defer it
+			# when contended so a pure read never blocks the caller
+			if lock.tryLock():
+				try:
+					if key in timestamps:
+						_moveToEnd(timestamps, key)
+					while pending:
+						pendingKey = pending.popleft()
+						if pendingKey in timestamps:
+							_moveToEnd(timestamps, pendingKey)
+				finally:
+					lock.unlock()
+			else:
+				pending.append(key)
+				# bound the backlog, dropping the oldest deferred update
+				# is harmless since recency hints are best-effort anyway
+				if len(pending) > 2 * maxLength:
+					try:
+						pending.popleft()
+					except IndexError:
+						pass
+			return entry[0]
+	lock.lock()
+	try:
+		then = timestamps.get(key)
+		if then is not None and (now - then) <= maxAge:
+			entry = results.get(key)
+			if entry is not None:
+				shard.hitCount.increment()
+				_moveToEnd(timestamps, key)
+				# drain the deferred recency updates from the fast path
+				pending = shard.pending
+				while pending:
+					pendingKey = pending.popleft()
+					if pendingKey in timestamps:
+						_moveToEnd(timestamps, pendingKey)
+				return entry[0]
+		# stale or missing, drop any dead entry and grab the key
+		# lock while the shard lock is still held
+		if then is not None:
+			timestamps.pop(key, None)
+			results.pop(key, None)
+		keyLock = shard.keyLocks.setdefault(key, ReentrantLock())
+	finally:
+		lock.unlock()
+	# compute under the per-key lock only, misses on different
+	# keys proceed in parallel while duplicate calls for the same
+	# key still collapse into a single computation
+	keyLock.lock()
+	try:
+		entry = results.get(key)
+		then = timestamps.get(key)
+		if entry is not None and then is not None and (JSystem.currentTimeMillis() - then) <= maxAge:
+			# another thread populated the entry while this one
+			# waited on the key lock
+			shard.hitCount.increment()
+			result = entry[0]
+		else:
+			shard.missCount.increment()
+			result = func(*args, **kwargs)
+			now = JSystem.currentTimeMillis()
+			lock.lock()
+			try:
+				# the structured args/kwargs ride along with the value
+				# so invalidateCache can filter without decoding the key
+				results[key] = (result, args, kwargs)
+				timestamps[key] = now
+				shard.insertCount += 1
+				# drain the deferred recency updates before deciding
+				# what is oldest, otherwise a recently hit entry
+				# could be evicted
+				pending = shard.pending
+				while pending:
+					pendingKey = pending.popleft()
+					if pendingKey in timestamps:
+						_moveToEnd(timestamps, pendingKey)
+				# amortize the length trim over every 16th insert
+				if (shard.insertCount & 15) == 0:
+					limit = maxLength // _SHARD_COUNT or 1
+					while len(timestamps) > limit:
+						oldestKey, oldestMillis = timestamps.popitem(last=False)
+						results.pop(oldestKey, None)
+					# opportunistically drop expired entries sitting at
+					# the lru end while the lock is already held, the
+					# sweep only reads the timestamps, never the results
+					while timestamps:
+						oldestKey = next(iter(timestamps))
+						if (now - timestamps[oldestKey]) > maxAge:
+							del timestamps[oldestKey]
+							results.pop(oldestKey, None)
+						else:
+							break
+			finally:
+				lock.unlock()
+	finally:
+		keyLock.unlock()
+	lock.lock()
+	try:
+		shard.keyLocks.pop(key, None)
+	finally:
+		lock.unlock()
+	return result
+
+
 def lruCache(event, maxLength=10, maxAge=10000):
 	"""Decorator that builds/updates the cache and then
 	reads the cache before calling the function each time
@@ -27,56 +224,70 @@ def lruCache(event, maxLength=10, maxAge=10000):
 		maxAge: long, optional, default to 10,000, max age of an entry in milliseconds before it is invalidated.
 	"""
 	def buildCache(func):
-		"""This function sets up the cacheParams object that 
-		contains cache parameters and the actual cache itself which
-		is just an OrderedDict from the collections module.
+		"""This function sets up the cacheParams object that contains
+		cache parameters and the actual cache itself, which is split
+		into _SHARD_COUNT stripes guarded by their own Locks so
+		concurrent calls only contend when they hash to the same
+		stripe.
 		"""
 		jComponent = event.source
 		key = _getJComponentKey(jComponent, func)
 		cacheParams = jComponent.getClientProperty(key)
 		if cacheParams is None:
 			cacheParams = {
-				'hitCount': 0,
-				'missCount': 0,
-				'orderedDict': OrderedDict(),
-				'lock': Lock()
+				'shards': [_CacheShard() for _ in range(_SHARD_COUNT)]
 			}
 			jComponent.putClientProperty(key, cacheParams)
 		cacheParams.update({
 			'maxLength': maxLength,
 			'maxAge': maxAge,
 		})
-		
+		funcName = func.__name__
+
+		# specialize for plain positional signatures, which is what the
+		# decorated handlers almost always have, so the common case skips
+		# the kwargs sorting and the *args/**kwargs packing entirely
+		spec = _argSpecCache.get(func.__code__)
+		if spec is None:
+			spec = getargspec(func)
+			_argSpecCache[func.__code__] = spec
+		if (not spec.varargs and not spec.keywords and not spec.defaults
+				and not _INJECTED_NAMES.intersection(spec.args)):
+			argNames = tuple(spec.args)
+			factory = _specializedFactories.get(argNames)
+			if factory is None:
+				# compile a factory once per signature shape, the per-event
+				# decoration then only creates a cheap closure over it
+				names = ', '.join(argNames)
+				argTuple = '(%s,)' % names if argNames else '()'
+				src = ('def _factory_(_cacheParams_, _func_, _funcName_):\n'
+					   '\tdef useCache(%s):\n'
+					   '\t\treturn _cacheLookup_(_cacheParams_, _func_, (_funcName_, %s, ()), %s, _noKwargs_)\n'
+					   '\treturn useCache\n'
+					   % (names, argTuple, argTuple))
+				namespace = {
+					'_cacheLookup_': _cacheLookup,
+					'_noKwargs_': _NO_KWARGS,
+				}
+				exec(src, namespace)
+				factory = namespace['_factory_']
+				_specializedFactories[argNames] = factory
+			return wraps(func)(factory(cacheParams, func, funcName))
+
 		@wraps(func)
 		def useCache(*args, **kwargs):
-			"""This function wraps the target function and will look for the 
+			"""This function wraps the target function and will look for the
 			result in the cache before calling the function to retrieve a fresh
 			result. This function is thread safe which enables the use of caching
 			with asyncPropertyChangeHandler
 			"""
-			key = '.'.join((jComponent.name, func.__name__, '__cache'))
-			cacheParams = jComponent.getClientProperty(key)
-			with cacheParams['lock']:
-				od = cacheParams['orderedDict']
-				key = ((func.__name__, )
-					   + ('args:', )
-					   + args 
-					   + ('kwargs:', )
-					   + tuple([(k, kwargs[k]) for k in sorted(kwargs.keys())]))
-				now = system.date.now()
-				try:
-					result, then = od.pop(key)
-					if system.date.millisBetween(then, now) > cacheParams['maxAge']:
-						raise KeyError
-					cacheParams['hitCount'] += 1
-					od[key] = (result, then)
-				except KeyError:
-					cacheParams['missCount'] += 1
-					result = func(*args, **kwargs)
-					od[key] = (result, now)
-				if len(od) > cacheParams['maxLength']:
-					oldestKey, oldestResult = od.popitem(last=False)
-				return result
+			if not kwargs:
+				kwargItems = ()
+			elif len(kwargs) == 1:
+				kwargItems = tuple(kwargs.items())
+			else:
+				kwargItems = tuple(sorted(kwargs.items()))
+			return _cacheLookup(cacheParams, func, (funcName, args, kwargItems), args, kwargs)
 		return useCache
 	return buildCache
 
@@ -92,15 +303,18 @@ def resetCache(event, func):
 	jComponent = event.source
 	key = _getJComponentKey(jComponent, func)
 	cacheParams = jComponent.getClientProperty(key)
-	if (cacheParams is not None):
-		with cacheParams['lock']:
-			cacheParams['orderedDict'].clear()
-			cacheParams['hitCount'] = 0
-			cacheParams['missCount'] = 0
-	else:
-		msg = 'Could not find cacheParams for component with name {} and function with name {}'
-		msg = msg.format(jComponent.name, func.__name__)
-		raise ValueError(msg)
+	# nothing to reset before the cache has been warmed
+	if cacheParams is None:
+		return None
+	for shard in cacheParams['shards']:
+		shard.lock.lock()
+		try:
+			shard.results.clear()
+			shard.timestamps.clear()
+		finally:
+			shard.lock.unlock()
+		shard.hitCount.reset()
+		shard.missCount.reset()
 
 
 def invalidateCache(event, func, filterFunc=lambda args, kwargs: True):
@@ -120,23 +334,25 @@ def invalidateCache(event, func, filterFunc=lambda args, kwargs: True):
 	jComponent = event.source
 	key = _getJComponentKey(jComponent, func)
 	cacheParams = jComponent.getClientProperty(key)
-	if (cacheParams is not None):
-		with cacheParams['lock']:
-			count = 0
-			od = cacheParams['orderedDict']
-			for key in od.keys():
-				argsIdx = key.index('args:')
-				kwargsIdx = key.index('kwargs:')
-				args = key[argsIdx+1:kwargsIdx]
-				kwargs = {k: v for (k, v) in key[kwargsIdx:+1]}
-				if filterFunc(args, kwargs):
-					del od[key]
+	# nothing to invalidate before the cache has been warmed
+	if cacheParams is None:
+		return 0
+	count = 0
+	for shard in cacheParams['shards']:
+		shard.lock.lock()
+		try:
+			results = shard.results
+			timestamps = shard.timestamps
+			# snapshot the keys, the loop deletes entries as it goes
+			for key in list(timestamps.keys()):
+				entry = results.get(key)
+				if entry is None or filterFunc(entry[1], entry[2]):
+					del timestamps[key]
+					results.pop(key, None)
 					count += 1
-		return count
-	else:
-		msg = 'Could not find cacheParams for component with name {} and function with name {}'
-		msg = msg.format(jComponent.name, func.__name__)
-		raise ValueError(msg)		
+		finally:
+			shard.lock.unlock()
+	return count
 
 
 def getCacheStats(event, func):
@@ -149,19 +365,25 @@ def getCacheStats(event, func):
 	jComponent=event.source
 	key = _getJComponentKey(jComponent, func)
 	cacheParams = jComponent.getClientProperty(key)
-	if (cacheParams is not None):
-		with cacheParams['lock']:
-			hitCount = cacheParams['hitCount']
-			missCount = cacheParams['missCount']
-		total = hitCount + missCount
-		percentage = 100 * hitCount / total if total != 0 else 0
+	# an unwarmed cache just has empty stats
+	if cacheParams is None:
 		return {
-			'hitCount': hitCount,
-			'missCount': missCount,
-			'total': total,
-			'percentage': percentage
+			'hitCount': 0,
+			'missCount': 0,
+			'total': 0,
+			'percentage': 0
 		}
-	else:
-		msg = 'Could not find cacheParams for component with name {} and function with name {}'
-		msg = msg.format(jComponent.name, func.__name__)
-		raise ValueError(msg)
+	# LongAdder.sum() is wait-free, no locks needed for the read
+	hitCount = 0
+	missCount = 0
+	for shard in cacheParams['shards']:
+		hitCount += shard.hitCount.sum()
+		missCount += shard.missCount.sum()
+	total = hitCount + missCount
+	percentage = 100 * hitCount / total if total != 0 else 0
+	return {
+		'hitCount': hitCount,
+		'missCount': missCount,
+		'total': total,
+		'percentage': percentage
+	}
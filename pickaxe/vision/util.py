@@ -4,10 +4,79 @@ from traceback import format_exc
 from java.awt import Toolkit
 from java.awt.datatransfer import StringSelection, DataFlavor
 from java.lang import Exception as JavaException
-from java.util.concurrent import CompletableFuture
+from java.lang import System as JSystem
+from java.lang import Thread
+from java.util import WeakHashMap
+from java.util.concurrent import CompletableFuture, Executors, ThreadFactory
 from pickaxe.java_wrappers.function_wrappers import RunnableWrapper
 
 
+# bound once at module load, each system.* call site otherwise pays two
+# PyModule attribute lookups on every swing event
+_invokeLater = system.util.invokeLater
+_PCH_LOGGER = system.util.getLogger('pickaxe.vision.util.propertyChangeHandler')
+_APCH_LOGGER = system.util.getLogger('pickaxe.vision.util.asyncPropertyChangeHandler')
+
+
+class _DaemonThreadFactory(ThreadFactory):
+	"""Thread factory that marks its threads as daemons so the shared
+	async pool never keeps the JVM alive on shutdown.
+	"""
+
+	def newThread(self, runnable):
+		thread = Thread(runnable, 'pickaxe-vision-async')
+		thread.setDaemon(True)
+		return thread
+
+
+# bounded pool for asyncPropertyChangeHandler jobs, keeps rapid property
+# changes from flooding the JVM-wide common ForkJoinPool
+_ASYNC_POOL = Executors.newFixedThreadPool(4, _DaemonThreadFactory())
+
+
+# cache of code object -> (argNames, argNameSet), the handler decorators
+# fire per property change but the underlying code object is compiled
+# once, so the getargspec reflection only needs to run the first time
+_argCache = {}
+
+
+def _getPropNames(func):
+	entry = _argCache.get(func.__code__)
+	if entry is None:
+		argNames = getargspec(func).args
+		entry = (argNames, frozenset(argNames))
+		_argCache[func.__code__] = entry
+	return entry
+
+
+# debounce bookkeeping keyed on the component itself, hash and equality
+# delegate to the stable java hashCode/equals (id() of a java object is
+# not reliable across crossings on jython), and the WeakHashMap lets the
+# per-component records die with their component instead of outliving it
+_debounceState = WeakHashMap()
+
+
+def _getDebounceState(jComponent, funcName, suffix):
+	"""Returns the mutable [lastMillis, future] record for a
+	component/handler pair, creating it on first use.
+
+	Args:
+		jComponent: instance of a JComponent
+		funcName: str, name of the decorated handler function
+		suffix: str, distinguishes the handler flavours
+	"""
+	states = _debounceState.get(jComponent)
+	if states is None:
+		states = {}
+		_debounceState.put(jComponent, states)
+	key = (funcName, suffix)
+	state = states.get(key)
+	if state is None:
+		state = [0, None]
+		states[key] = state
+	return state
+
+
 
 def copyToClipboard(string_data):
 	"""Copies string data to the clipboard
@@ -37,7 +106,7 @@ def onMainThread(func):
 			def updateGui():
 				this.data = data
 	"""
-	system.util.invokeLater(func)
+	_invokeLater(func)
 
 
 def propertyChangeHandler(event, millis=50):
@@ -58,25 +127,24 @@ def propertyChangeHandler(event, millis=50):
 			...
 	"""
 	def outer(func, jComponent=event.source, millis=millis):
-		# create a key for persisting data
-		key = '.'.join((jComponent.name, func.__name__, '__pch'))
 		# check if the function needs to be invoked or not
-		now = system.date.toMillis(system.date.now())
-		delta = now - long(jComponent.getClientProperty(key) or 0)
-		propNames = getargspec(func).args
-		if (delta > millis) and (event.propertyName in propNames):
-			logger = system.util.getLogger('pickaxe.vision.util.propertyChangeHandler')
-			if logger.isDebugEnabled():
+		state = _getDebounceState(jComponent, func.__name__, '__pch')
+		now = JSystem.currentTimeMillis()
+		delta = now - state[0]
+		propNames, propNameSet = _getPropNames(func)
+		if (delta > millis) and (event.propertyName in propNameSet):
+			if _PCH_LOGGER.isDebugEnabled():
 				msg = 'propertyChangeHandler called for component = {}, and function = {}'
 				msg = msg.format(jComponent.name, func.__name__)
-				logger.debug(msg)
+				_PCH_LOGGER.debug(msg)
 			# if it does need to be run, update the last run time
-			jComponent.putClientProperty(key, now)
-			# run the function in <x> milliseconds to allow any other events to process
-			def inner():
+			state[0] = now
+			# run the function in <x> milliseconds to allow any other events to process,
+			# the defaults turn the closure reads into cheap local loads
+			def inner(jComponent=jComponent, propNames=propNames, func=func):
 				kwargs = {name: getattr(jComponent, name, None) for name in propNames}
 				func(**kwargs)
-			system.util.invokeLater(inner, millis)
+			_invokeLater(inner, millis)
 		return func
 	return outer
 
@@ -108,25 +176,23 @@ def asyncPropertyChangeHandler(event, millis=50):
 				this.otherData = otherData
 	"""
 	def outer(func, jComponent=event.source, millis=millis):
-		# create a key for persisting data
-		key = key = '.'.join((jComponent.name, func.__name__, '__apch'))
-		cfKey = key + '.__cf'
 		# check if the function needs to be invoked or not
-		now = system.date.toMillis(system.date.now())
-		delta = now - long(jComponent.getClientProperty(key) or 0)
-		cf = jComponent.getClientProperty(cfKey)
-		propNames = getargspec(func).args
-		if ((delta > millis) and (event.propertyName in propNames)
+		state = _getDebounceState(jComponent, func.__name__, '__apch')
+		now = JSystem.currentTimeMillis()
+		delta = now - state[0]
+		cf = state[1]
+		propNames, propNameSet = _getPropNames(func)
+		if ((delta > millis) and (event.propertyName in propNameSet)
 			and ((cf is None) or cf.isDone())):
 			# if it does need to be run, update the last run time
-			jComponent.putClientProperty(key, now)
-			logger = system.util.getLogger('pickaxe.vision.util.asyncPropertyChangeHandler')
-			if logger.isDebugEnabled():
+			state[0] = now
+			if _APCH_LOGGER.isDebugEnabled():
 				msg = 'propertyChangeHandler called for component = {}, and function = {}'
 				msg = msg.format(jComponent.name, func.__name__)
-				logger.debug(msg)
-			# run the function in <x> milliseconds to allow any other events to process
-			def inner():
+				_APCH_LOGGER.debug(msg)
+			# run the function in <x> milliseconds to allow any other events to process,
+			# the defaults turn the closure reads into cheap local loads
+			def inner(jComponent=jComponent, propNames=propNames, func=func):
 				kwargs = {name: getattr(jComponent, name, None) for name in propNames}
 				
 				# create a wrapper to handle passing exception info between threads
@@ -141,9 +207,8 @@ def asyncPropertyChangeHandler(event, millis=50):
 							msg = msg.format(e, stackTrace)
 							raise Exception(msg)
 				
-				cf = CompletableFuture.runAsync(RunnableWrapper(lambda: wrapper(**kwargs)))
-				jComponent.putClientProperty(cfKey, cf)
-			system.util.invokeLater(inner, millis)
+				state[1] = CompletableFuture.runAsync(RunnableWrapper(lambda: wrapper(**kwargs)), _ASYNC_POOL)
+			_invokeLater(inner, millis)
 		return func
 	return outer
 